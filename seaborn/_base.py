@@ -2,7 +2,6 @@ from __future__ import annotations
 import warnings
 import itertools
 from copy import copy
-from collections import UserString
 from collections.abc import Iterable, Sequence, Mapping
 from numbers import Number
 from datetime import datetime
@@ -18,14 +17,18 @@ from seaborn.palettes import (
 )
 from seaborn.utils import (
     _check_argument,
+    _marker_style,
     _version_predates,
     desaturate,
     locator_to_legend_entries,
     get_color_cycle,
-    remove_na,
 )
 
 
+# Sentinel distinguishing absent lookup table keys from stored None values
+_MISSING = object()
+
+
 class SemanticMapping:
     """Base class for mapping data values to plot attributes."""
 
@@ -40,6 +43,9 @@ class SemanticMapping:
     # A mapping from the data values to corresponding plot attributes
     lookup_table = None
 
+    # An object-dtype Series over lookup_table, enabling vectorized lookup
+    _lookup_series = None
+
     def __init__(self, plotter):
 
         # TODO Putting this here so we can continue to use a lot of the
@@ -79,11 +85,42 @@ class SemanticMapping:
 
     def __call__(self, key, *args, **kwargs):
         """Get the attribute(s) values for the data key."""
-        if isinstance(key, (list, np.ndarray, pd.Series)):
+        # The ndim probe accepts other array-likes (Index, ExtensionArray)
+        # without allocating, so callers need not coerce to list first
+        vector = (
+            isinstance(key, (list, np.ndarray, pd.Series))
+            or getattr(key, "ndim", 0) >= 1
+        )
+        if vector:
+            use_bulk = (
+                self._lookup_series is not None and not args and not kwargs
+                # Plain lists stay on the scalar path: converting them to
+                # an array can corrupt keys (mixed types coerce to strings,
+                # tuple-valued levels become a 2D array) before the lookup
+                and not isinstance(key, list)
+            )
+            if use_bulk:
+                return self._lookup_bulk(key)
             return [self._lookup_single(k, *args, **kwargs) for k in key]
         else:
             return self._lookup_single(key, *args, **kwargs)
 
+    def _lookup_bulk(self, keys):
+        """Apply the mapping to a vector of data values in one pass."""
+        series = self._lookup_series
+        keys = np.asarray(keys)
+        try:
+            indexer = series.index.get_indexer(keys)
+        except (TypeError, ValueError, pd.errors.InvalidIndexError):
+            return [self._lookup_single(k) for k in keys]
+        values = series.to_numpy().take(indexer).tolist()
+        if (indexer < 0).any():
+            # Route keys that are not in the table through the scalar
+            # path, which knows how to interpolate / assign null values
+            for i in np.nonzero(indexer < 0)[0]:
+                values[i] = self._lookup_single(keys[i])
+        return values
+
 
 class HueMapping(SemanticMapping):
     """Mapping that sets artist colors according to data values."""
@@ -169,13 +206,52 @@ class HueMapping(SemanticMapping):
             self.levels = levels
             self.norm = norm
             self.cmap = cmap
+            if saturation == 1 and lookup_table:
+                # Object dtype so looked-up values come back unmodified
+                self._lookup_series = pd.Series(lookup_table, dtype=object)
+
+                # Specialize the scalar lookup for this mapping: the table
+                # get is bound as a local, so per-key calls avoid repeated
+                # attribute loads; misses defer to the general method
+                table_get = lookup_table.get
+                interpolate = self._lookup_single
+
+                def _lookup_single(key):
+                    value = table_get(key, _MISSING)
+                    if value is not _MISSING:
+                        return value
+                    return interpolate(key)
+
+                self._lookup_single = _lookup_single
+
+    def __call__(self, key, *args, **kwargs):
+        """Get the color(s) for the data key, vectorizing numeric mappings."""
+        if (
+            self.map_type == "numeric"
+            # With a dict palette, the colormap is a quantized ListedColormap
+            # and the lookup table takes priority over interpolation
+            and not isinstance(self.palette, dict)
+            and self.saturation == 1
+            and not args and not kwargs
+            and isinstance(key, (np.ndarray, pd.Series))
+        ):
+            try:
+                arr = np.asarray(key, dtype=float)
+            except (TypeError, ValueError):
+                pass
+            else:
+                # One C-level pass through norm and cmap; invalid values
+                # come back masked and map to the colormap's bad color.
+                # Keep the (N, 4) array form that matplotlib consumes
+                return self.cmap(self.norm(arr))
+        return super().__call__(key, *args, **kwargs)
 
     def _lookup_single(self, key):
         """Get the color for a single value, using colormap to interpolate."""
-        try:
-            # Use a value that's in the original data vector
-            value = self.lookup_table[key]
-        except KeyError:
+        # Use a value that's in the original data vector, keeping the common
+        # in-table case free of try/except dispatch overhead
+        value = self.lookup_table.get(key, _MISSING)
+        if value is _MISSING:
 
             if self.norm is None:
                 # Currently we only get here in scatterplot with hue_order,
@@ -221,15 +297,15 @@ class HueMapping(SemanticMapping):
         """Determine colors when the hue mapping is categorical."""
         # -- Identify the order and name of the levels
 
-        levels = categorical_order(data, order)
+        levels = self.plotter._get_categorical_order("hue", data, order)
         n_colors = len(levels)
 
         # -- Identify the set of colors to use
 
         if isinstance(palette, dict):
 
-            missing = set(levels) - set(palette)
-            if any(missing):
+            missing = [k for k in levels if k not in palette]
+            if missing:
                 err = "The palette dictionary is missing keys: {}"
                 raise ValueError(err.format(missing))
 
@@ -265,7 +341,9 @@ class HueMapping(SemanticMapping):
         else:
 
             # The levels are the sorted unique values in the data
-            levels = list(np.sort(remove_na(data.unique())))
+            # Sort and dedup in one pass over the dropna'd values
+            levels_arr = np.unique(data.dropna().to_numpy())
+            levels = list(levels_arr)
 
             # --- Sort out the colormap to use from the palette argument
 
@@ -290,7 +368,11 @@ class HueMapping(SemanticMapping):
             if not norm.scaled():
                 norm(np.asarray(data.dropna()))
 
-            lookup_table = dict(zip(levels, cmap(norm(levels))))
+            # Keep the levels as an array here so norm and cmap vectorize,
+            # but store plain tuples so each lookup hands matplotlib a
+            # primitive color rather than an ndarray row to re-convert
+            colors = map(tuple, cmap(norm(levels_arr)).tolist())
+            lookup_table = dict(zip(levels, colors))
 
         return levels, lookup_table, norm, cmap
 
@@ -354,7 +436,14 @@ class SizeMapping(SemanticMapping):
             self.norm = norm
             self.sizes = sizes
             self.size_range = size_range
+            if size_range is not None:
+                # Precompute the interpolation endpoints so per-key lookups
+                # do not redo the arithmetic
+                self._size_lo = size_range[0]
+                self._size_span = size_range[1] - size_range[0]
             self.lookup_table = lookup_table
+            if lookup_table:
+                self._lookup_series = pd.Series(lookup_table, dtype=object)
 
     def infer_map_type(self, norm, sizes, var_type):
 
@@ -367,26 +456,46 @@ class SizeMapping(SemanticMapping):
 
         return map_type
 
+    def __call__(self, key, *args, **kwargs):
+        """Get the size(s) for the data key, vectorizing numeric mappings."""
+        if (
+            self.map_type == "numeric"
+            # With a dict of sizes, the lookup table takes priority
+            # over interpolation through the norm
+            and not isinstance(self.sizes, dict)
+            and not args and not kwargs
+            and isinstance(key, (np.ndarray, pd.Series))
+        ):
+            try:
+                arr = np.asarray(key, dtype=float)
+            except (TypeError, ValueError):
+                pass
+            else:
+                # One pass through the norm; masked (invalid) entries
+                # come back as nan, matching the scalar path
+                normed = np.ma.filled(self.norm(arr), np.nan)
+                return self._size_lo + normed * self._size_span
+        return super().__call__(key, *args, **kwargs)
+
     def _lookup_single(self, key):
 
-        try:
-            value = self.lookup_table[key]
-        except KeyError:
+        value = self.lookup_table.get(key, _MISSING)
+        if value is _MISSING:
             normed = self.norm(key)
             if np.ma.is_masked(normed):
                 normed = np.nan
-            value = self.size_range[0] + normed * np.ptp(self.size_range)
+            value = self._size_lo + normed * self._size_span
         return value
 
     def categorical_mapping(self, data, sizes, order):
 
-        levels = categorical_order(data, order)
+        levels = self.plotter._get_categorical_order("size", data, order)
 
         if isinstance(sizes, dict):
 
             # Dict inputs map existing data values to the size attribute
-            missing = set(levels) - set(sizes)
-            if any(missing):
+            missing = [k for k in levels if k not in sizes]
+            if missing:
                 err = f"Missing sizes for the following levels: {missing}"
                 raise ValueError(err)
             lookup_table = sizes.copy()
@@ -442,14 +551,17 @@ class SizeMapping(SemanticMapping):
             # The presence of a norm object overrides a dictionary of sizes
             # in specifying a numeric mapping, so we need to process it
             # dictionary here
-            levels = list(np.sort(list(sizes)))
+            levels_arr = np.sort(list(sizes))
+            levels = list(levels_arr)
             size_values = sizes.values()
             size_range = min(size_values), max(size_values)
 
         else:
 
             # The levels here will be the unique values in the data
-            levels = list(np.sort(remove_na(data.unique())))
+            # Sort and dedup in one pass over the dropna'd values
+            levels_arr = np.unique(data.dropna().to_numpy())
+            levels = list(levels_arr)
 
             if isinstance(sizes, tuple):
 
@@ -500,10 +612,11 @@ class SizeMapping(SemanticMapping):
 
         # If the input range is not set, use the full range of the data
         if not norm.scaled():
-            norm(levels)
+            norm(levels_arr)
 
-        # Map from data values to [0, 1] range
-        sizes_scaled = norm(levels)
+        # Map from data values to [0, 1] range; pass the array form so the
+        # norm does not have to box each element
+        sizes_scaled = norm(levels_arr)
 
         # Now map from the scaled range into the artist units
         if isinstance(sizes, dict):
@@ -537,11 +650,11 @@ class StyleMapping(SemanticMapping):
         if data.notna().any():
 
             # Cast to list to handle numpy/pandas datetime quirks
-            if variable_type(data) == "datetime":
+            if plotter.var_types["style"] == "datetime":
                 data = list(data)
 
             # Find ordered unique values
-            levels = categorical_order(data, order)
+            levels = plotter._get_categorical_order("style", data, order)
 
             markers = self._map_attributes(
                 markers, levels, unique_markers(len(levels)), "markers",
@@ -550,21 +663,36 @@ class StyleMapping(SemanticMapping):
                 dashes, levels, unique_dashes(len(levels)), "dashes",
             )
 
-            # Build the paths matplotlib will use to draw the markers
+            # Build the paths matplotlib will use to draw the markers,
+            # constructing each distinct marker spec only once even when
+            # it is repeated across many levels
             paths = {}
-            filled_markers = []
-            for k, m in markers.items():
-                if not isinstance(m, mpl.markers.MarkerStyle):
-                    m = mpl.markers.MarkerStyle(m)
-                paths[k] = m.get_path().transformed(m.get_transform())
-                filled_markers.append(m.is_filled())
+            filled_markers = np.empty(len(markers), bool)
+            spec_cache = {}
+            for i, (k, m) in enumerate(markers.items()):
+                try:
+                    path, filled = spec_cache[m]
+                except (KeyError, TypeError):
+                    if isinstance(m, mpl.markers.MarkerStyle):
+                        style = m
+                    else:
+                        style = _marker_style(m)
+                    path = style.get_path().transformed(style.get_transform())
+                    filled = style.is_filled()
+                    try:
+                        spec_cache[m] = path, filled
+                    except TypeError:
+                        # Unhashable spec (e.g. a vertex list); skip caching
+                        pass
+                paths[k] = path
+                filled_markers[i] = filled
 
             # Mixture of filled and unfilled markers will show line art markers
             # in the edge color, which defaults to white. This can be handled,
             # but there would be additional complexity with specifying the
             # weight of the line art markers without overwhelming the filled
             # ones with the edges. So for now, we will disallow mixtures.
-            if any(filled_markers) and not all(filled_markers):
+            if filled_markers.any() and not filled_markers.all():
                 err = "Filled and line art markers cannot be mixed"
                 raise ValueError(err)
 
@@ -593,7 +721,7 @@ class StyleMapping(SemanticMapping):
         if arg is True:
             lookup_table = dict(zip(levels, defaults))
         elif isinstance(arg, dict):
-            missing = set(levels) - set(arg)
+            missing = [k for k in levels if k not in arg]
             if missing:
                 err = f"These `{attr}` levels are missing values: {missing}"
                 raise ValueError(err)
@@ -633,12 +761,20 @@ class VectorPlotter:
         self._var_ordered = {"x": False, "y": False}  # alt., used DefaultDict
         self.assign_variables(data, variables)
 
-        # TODO Lots of tests assume that these are called to initialize the
-        # mappings to default values on class initialization. I'd prefer to
-        # move away from that and only have a mapping when explicitly called.
-        for var in ["hue", "size", "style"]:
-            if var in variables:
+        # Semantic mappings are created lazily, on first attribute access
+        # (see __getattr__), so that plots which never consult a mapping do
+        # not pay for default palette or marker-path construction.
+
+    def __getattr__(self, name):
+        if name in ("_hue_map", "_size_map", "_style_map"):
+            var = name[1:-4]
+            if var in self.__dict__.get("variables", {}):
+                # Initialize the mapping with default parameters on first
+                # access; the map_* methods replace it when given parameters
                 getattr(self, f"map_{var}")()
+                return self.__dict__[name]
+        err = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(err)
 
     @property
     def has_xy_data(self):
@@ -690,8 +826,23 @@ class VectorPlotter:
             for v in names
         }
 
+        # Levels for each variable are requested by multiple semantic
+        # mappings; cache them so each column is only scanned once
+        self._categorical_order_cache = {}
+
         return self
 
+    def _get_categorical_order(self, var, data, order=None):
+        """Memoized categorical_order for a plot_data column."""
+        if order is not None:
+            return categorical_order(data, order)
+        try:
+            return self._categorical_order_cache[var]
+        except KeyError:
+            levels = categorical_order(data)
+            self._categorical_order_cache[var] = levels
+            return levels
+
     def _assign_variables_wideform(self, data=None, **kwargs):
         """Define plot variables given wide-form data.
 
@@ -726,14 +877,19 @@ class VectorPlotter:
         empty = data is None or not len(data)
 
         # Then, determine if we have "flat" data (a single vector)
-        if isinstance(data, dict):
-            values = data.values()
+        if getattr(data, "ndim", 1) > 1:
+            # A rectangular structure always holds a collection of vectors;
+            # don't materialize an object array of every cell to learn that
+            flat = False
         else:
-            values = np.atleast_1d(np.asarray(data, dtype=object))
-        flat = not any(
-            isinstance(v, Iterable) and not isinstance(v, (str, bytes))
-            for v in values
-        )
+            if isinstance(data, dict):
+                values = data.values()
+            else:
+                values = np.atleast_1d(np.asarray(data, dtype=object))
+            flat = not any(
+                isinstance(v, Iterable) and not isinstance(v, (str, bytes))
+                for v in values
+            )
 
         if empty:
 
@@ -744,9 +900,10 @@ class VectorPlotter:
         elif flat:
 
             # Handle flat data by converting to pandas Series and using the
-            # index and/or values to define x and/or y
+            # index and/or values to define x and/or y; the data are only
+            # read from here, so no defensive copy is needed
             # (Could be accomplished with a more general to_series() interface)
-            flat_data = pd.Series(data).copy()
+            flat_data = data if isinstance(data, pd.Series) else pd.Series(data)
             names = {
                 "@values": flat_data.name,
                 "@index": flat_data.index.name
@@ -783,7 +940,10 @@ class VectorPlotter:
             # Pandas requires that dict values either be Series objects
             # or all have the same length, but we want to allow "ragged" inputs
             if isinstance(data, Mapping):
-                data = {key: pd.Series(val) for key, val in data.items()}
+                data = {
+                    key: val if isinstance(val, pd.Series) else pd.Series(val)
+                    for key, val in data.items()
+                }
 
             # Otherwise, delegate to the pandas DataFrame constructor
             # This is where we'd prefer to use a general interface that says
@@ -797,31 +957,23 @@ class VectorPlotter:
             ]
             wide_data = wide_data[numeric_cols]
 
-            # Now melt the data to long form
-            melt_kws = {"var_name": "@columns", "value_name": "@values"}
-            use_index = "@index" in self.wide_structure.values()
-            if use_index:
-                melt_kws["id_vars"] = "@index"
-                try:
-                    orig_categories = wide_data.columns.categories
-                    orig_ordered = wide_data.columns.ordered
-                    wide_data.columns = wide_data.columns.add_categories("@index")
-                except AttributeError:
-                    category_columns = False
-                else:
-                    category_columns = True
-                wide_data["@index"] = wide_data.index.to_series()
-
-            plot_data = wide_data.melt(**melt_kws)
-
-            if use_index and category_columns:
-                plot_data["@columns"] = pd.Categorical(plot_data["@columns"],
-                                                       orig_categories,
-                                                       orig_ordered)
+            # Now reshape the data to long form, equivalent to a melt but with
+            # one contiguous copy of the values rather than a full pandas
+            # reshape, and preserving the index and column dtypes directly
+            n_rows, n_cols = wide_data.shape
+            melted = {
+                "@columns": wide_data.columns.repeat(n_rows),
+                "@values": wide_data.to_numpy().ravel(order="F"),
+            }
+            if "@index" in self.wide_structure.values():
+                tiled = np.tile(np.arange(n_rows), n_cols)
+                melted["@index"] = wide_data.index.take(tiled)
 
-            # Assign names corresponding to plot semantics
-            for var, attr in self.wide_structure.items():
-                plot_data[var] = plot_data[attr]
+            # Assemble the columns that plot semantics refer to directly,
+            # rather than building intermediate columns and reprojecting
+            plot_data = pd.DataFrame({
+                var: melted[attr] for var, attr in self.wide_structure.items()
+            })
 
             # Define the variable names
             variables = {}
@@ -829,9 +981,6 @@ class VectorPlotter:
                 obj = getattr(wide_data, attr[1:])
                 variables[var] = getattr(obj, "name", None)
 
-            # Remove redundant columns from plot_data
-            plot_data = plot_data[list(variables)]
-
         return plot_data, variables
 
     def map_hue(self, palette=None, order=None, norm=None, saturation=1):
@@ -849,7 +998,7 @@ class VectorPlotter:
     def iter_data(
         self, grouping_vars=None, *,
         reverse=False, from_comp_data=False,
-        by_facet=True, allow_empty=False, dropna=True,
+        by_facet=True, allow_empty=False, dropna=True, copy=True,
     ):
         """Generator for getting subsets of data defined by semantic variables.
 
@@ -870,6 +1019,9 @@ class VectorPlotter:
             combinations of grouping variables.
         dropna : bool
             If True, remove rows with missing data.
+        copy : bool
+            If True, yield a copy of each data subset; callers that only
+            read the data can pass False to skip the allocation.
 
         Yields
         ------
@@ -930,40 +1082,46 @@ class VectorPlotter:
             grouped_data = data.groupby(
                 grouping_vars, sort=False, as_index=False, observed=False,
             )
+            # Resolve the membership table once; probing it per combination
+            # is much cheaper than a get_group call that can raise KeyError
+            group_indices = grouped_data.indices
 
             grouping_keys = []
             for var in grouping_vars:
                 key = levels.get(var)
                 grouping_keys.append([] if key is None else key)
 
-            iter_keys = itertools.product(*grouping_keys)
             if reverse:
-                iter_keys = reversed(list(iter_keys))
+                # Reversing every axis reverses the Cartesian order, without
+                # materializing the whole product just to flip it
+                grouping_keys = [list(reversed(k)) for k in grouping_keys]
+            iter_keys = itertools.product(*grouping_keys)
 
             for key in iter_keys:
 
-                pd_key = (
-                    key[0] if len(key) == 1 and _version_predates(pd, "2.2.0") else key
-                )
-                try:
-                    data_subset = grouped_data.get_group(pd_key)
-                except KeyError:
+                # The indices table is keyed by scalars when there is a
+                # single grouping variable, on all supported pandas versions
+                pd_key = key[0] if len(key) == 1 else key
+                idx = group_indices.get(pd_key)
+                if idx is None:
                     # XXX we are adding this to allow backwards compatibility
                     # with the empty artists that old categorical plots would
                     # add (before 0.12), which we may decide to break, in which
                     # case this option could be removed
                     data_subset = data.loc[[]]
+                else:
+                    data_subset = data.iloc[idx]
 
                 if data_subset.empty and not allow_empty:
                     continue
 
                 sub_vars = dict(zip(grouping_vars, key))
 
-                yield sub_vars, data_subset.copy()
+                yield sub_vars, data_subset.copy() if copy else data_subset
 
         else:
 
-            yield {}, data.copy()
+            yield {}, data.copy() if copy else data
 
     @property
     def comp_data(self):
@@ -986,30 +1144,65 @@ class VectorPlotter:
             for var in "yx":
                 if var not in self.variables:
                     continue
-
-                parts = []
-                grouped = self.plot_data[var].groupby(self.converters[var], sort=False)
-                for converter, orig in grouped:
-                    orig = orig.mask(orig.isin([np.inf, -np.inf]), np.nan)
-                    orig = orig.dropna()
-                    if var in self.var_levels:
-                        # TODO this should happen in some centralized location
-                        # it is similar to GH2419, but more complicated because
-                        # supporting `order` in categorical plots is tricky
-                        orig = orig[orig.isin(self.var_levels[var])]
-                    comp = pd.to_numeric(converter.convert_units(orig)).astype(float)
-                    transform = converter.get_transform().transform
-                    parts.append(pd.Series(transform(comp), orig.index, name=orig.name))
-                if parts:
-                    comp_col = pd.concat(parts)
-                else:
-                    comp_col = pd.Series(dtype=float, name=var)
-                comp_data.insert(0, var, comp_col)
+                # Realign explicitly and insert the bare array, which skips
+                # the (relatively slow) alignment machinery in insert
+                comp_col = self._comp_col(var).reindex(comp_data.index)
+                comp_data.insert(0, var, comp_col.to_numpy())
 
             self._comp_data = comp_data
 
         return self._comp_data
 
+    def _comp_col(self, var):
+        """Memoized unit conversion and scale transform for one data column."""
+        try:
+            return self._comp_col_cache[var]
+        except AttributeError:
+            self._comp_col_cache = {}
+        except KeyError:
+            pass
+
+        def convert_col(converter, orig):
+            # Drop inf and nan with one finite-mask pass over float
+            # data; integer and boolean columns cannot hold either
+            if orig.dtype.kind == "f":
+                orig = orig[np.isfinite(orig.to_numpy())]
+            elif orig.dtype.kind not in "iub":
+                orig = orig.mask(orig.isin([np.inf, -np.inf]), np.nan)
+                orig = orig.dropna()
+            if var in self.var_levels:
+                # TODO this should happen in some centralized location
+                # it is similar to GH2419, but more complicated because
+                # supporting `order` in categorical plots is tricky
+                orig = orig[orig.isin(self.var_levels[var])]
+            # convert_units usually hands back float data already;
+            # only pay for to_numeric and a cast when it does not
+            comp = converter.convert_units(orig)
+            if getattr(comp, "dtype", None) is None or comp.dtype.kind != "f":
+                comp = pd.to_numeric(comp).astype(float)
+            transform = converter.get_transform().transform
+            return pd.Series(transform(comp), orig.index, name=orig.name)
+
+        converters = self.converters[var]
+        unique_converters = converters.unique()
+        if len(unique_converters) == 1:
+            # With one converter (single or shared axes, the common
+            # case), convert the whole column without groupby/concat
+            comp_col = convert_col(unique_converters[0], self.plot_data[var])
+        elif len(unique_converters):
+            grouped = self.plot_data[var].groupby(converters, sort=False)
+            parts = [convert_col(converter, orig) for converter, orig in grouped]
+            if len(parts) == 1:
+                comp_col = parts[0]
+            else:
+                # The parts are freshly built, so concat can reuse their buffers
+                comp_col = pd.concat(parts, copy=False)
+        else:
+            comp_col = pd.Series(dtype=float, name=var)
+
+        self._comp_col_cache[var] = comp_col
+        return comp_col
+
     def _get_axes(self, sub_vars):
         """Return an Axes object based on existence of row/col variables."""
         row = sub_vars.get("row", None)
@@ -1091,23 +1284,29 @@ class VectorPlotter:
         for var in axis_variables:
             other_var = {"x": "y", "y": "x"}[var]
 
-            converter = pd.Series(index=self.plot_data.index, name=var, dtype=object)
+            axis_attr = f"{var}axis"
             share_state = getattr(self.facets, f"_share{var}", True)
 
+            # Fill a plain object array and wrap it in a Series at the end,
+            # avoiding pandas' object-dtype setitem path per assignment
+            index = self.plot_data.index
+            arr = np.empty(len(index), dtype=object)
+
             # Simplest cases are that we have a single axes, all axes are shared,
             # or sharing is only on the orthogonal facet dimension. In these cases,
             # all datapoints get converted the same way, so use the first axis
             if share_state is True or share_state == facet_dim[other_var]:
-                converter.loc[:] = getattr(ax_list[0], f"{var}axis")
+                arr[:] = getattr(ax_list[0], axis_attr)
 
             else:
 
                 # Next simplest case is when no axes are shared, and we can
                 # use the axis objects within each facet
                 if share_state is False:
-                    for axes_vars, axes_data in self.iter_data():
+                    for axes_vars, axes_data in self.iter_data(copy=False):
                         ax = self._get_axes(axes_vars)
-                        converter.loc[axes_data.index] = getattr(ax, f"{var}axis")
+                        positions = index.get_indexer_for(axes_data.index)
+                        arr[positions] = getattr(ax, axis_attr)
 
                 # In the more complicated case, the axes are shared within each
                 # "file" of the facetgrid. In that case, we need to subset the data
@@ -1115,24 +1314,38 @@ class VectorPlotter:
                 else:
 
                     names = getattr(self.facets, f"{share_state}_names")
+                    file_data = self.plot_data[share_state].to_numpy()
                     for i, level in enumerate(names):
                         idx = (i, 0) if share_state == "row" else (0, i)
-                        axis = getattr(self.facets.axes[idx], f"{var}axis")
-                        converter.loc[self.plot_data[share_state] == level] = axis
+                        axis = getattr(self.facets.axes[idx], axis_attr)
+                        arr[file_data == level] = axis
+
+            converter = pd.Series(arr, index=index, name=var)
 
             # Store the converter vector, which we use elsewhere (e.g comp_data)
             self.converters[var] = converter
 
             # Now actually update the matplotlib objects to do the conversion we want
-            grouped = self.plot_data[var].groupby(self.converters[var], sort=False)
-            for converter, seed_data in grouped:
+            # Seeding each distinct axis directly takes one pass over the
+            # column, where a groupby would allocate per-group frames
+            seed_values = self.plot_data[var]
+            unique_axes = pd.unique(converter)
+            for axis in unique_axes:
+                if axis is None:
+                    # Rows dropped from the facet iteration (e.g. with na
+                    # values) have no axis assigned
+                    continue
+                if len(unique_axes) > 1:
+                    seed_data = seed_values[arr == axis]
+                else:
+                    seed_data = seed_values
                 if self.var_types[var] == "categorical":
                     if self._var_ordered[var]:
                         order = self.var_levels[var]
                     else:
                         order = None
                     seed_data = categorical_order(seed_data, order)
-                converter.update_units(seed_data)
+                axis.update_units(seed_data)
 
         # -- Set numerical axis scales
 
@@ -1150,8 +1363,9 @@ class VectorPlotter:
         # Now use it
         for axis, scale in zip("xy", (scalex, scaley)):
             if scale:
+                set_scale_attr = f"set_{axis}scale"
                 for ax in ax_list:
-                    set_scale = getattr(ax, f"set_{axis}scale")
+                    set_scale = getattr(ax, set_scale_attr)
                     if scale is True:
                         set_scale("log", nonpositive="mask")
                     else:
@@ -1162,12 +1376,24 @@ class VectorPlotter:
             for ax in ax_list:
                 ax.yaxis.set_inverted(True)
 
+        # The axis scales are now settled; invalidate any transforms
+        # memoized against a previous attachment
+        self._scale_transform_cache = {}
+
         # TODO -- Add axes labels
 
     def _get_scale_transforms(self, axis):
         """Return a function implementing the scale transform (or its inverse)."""
+        # The scales do not change after _attach, so the (possibly faceted)
+        # axis scan only needs to happen once per axis
+        try:
+            return self._scale_transform_cache[axis]
+        except (AttributeError, KeyError):
+            pass
+
+        axis_attr = f"{axis}axis"
         if self.ax is None:
-            axis_list = [getattr(ax, f"{axis}axis") for ax in self.facets.axes.flat]
+            axis_list = [getattr(ax, axis_attr) for ax in self.facets.axes.flat]
             scales = {axis.get_scale() for axis in axis_list}
             if len(scales) > 1:
                 # It is a simplifying assumption that faceted axes will always have
@@ -1182,9 +1408,13 @@ class VectorPlotter:
             transform_obj = axis_list[0].get_transform()
         else:
             # This case is more straightforward
-            transform_obj = getattr(self.ax, f"{axis}axis").get_transform()
+            transform_obj = getattr(self.ax, axis_attr).get_transform()
 
-        return transform_obj.transform, transform_obj.inverted().transform
+        transforms = transform_obj.transform, transform_obj.inverted().transform
+        if not hasattr(self, "_scale_transform_cache"):
+            self._scale_transform_cache = {}
+        self._scale_transform_cache[axis] = transforms
+        return transforms
 
     def _add_axis_labels(self, ax, default_x="", default_y=""):
         """Add axis labels if not present, set visibility to match ticklabels."""
@@ -1414,7 +1644,10 @@ class VectorPlotter:
         # It feels more consistent, but technically will be a default change
         # If so, should also change categorical_order to behave that way
         if self.var_types[axis] == "numeric":
-            self.plot_data = self.plot_data.sort_values(axis, kind="mergesort")
+            # Sort positions from the single key column; sort_values would
+            # push every column through its multi-column machinery
+            order_idx = np.argsort(self.plot_data[axis].to_numpy(), kind="mergesort")
+            self.plot_data = self.plot_data.iloc[order_idx]
 
         # Now get a reference to the categorical data vector and remove na values
         cat_data = self.plot_data[axis].dropna()
@@ -1434,8 +1667,11 @@ class VectorPlotter:
             cat_data = cat_data.map(formatter)
             order = order.map(formatter)
         else:
-            cat_data = cat_data.astype(str)
-            order = order.astype(str)
+            # An explicit string dtype is already in its converted form
+            if not isinstance(cat_data.dtype, pd.StringDtype):
+                cat_data = cat_data.astype(str)
+            if not isinstance(order.dtype, pd.StringDtype):
+                order = order.astype(str)
 
         # Update the levels list with the type-converted order variable
         self.var_levels[axis] = order
@@ -1449,24 +1685,52 @@ class VectorPlotter:
         return self
 
 
-class VariableType(UserString):
+class VariableType(str):
     """
     Prevent comparisons elsewhere in the library from using the wrong name.
 
     Errors are simple assertions because users should not be able to trigger
     them. If that changes, they should be more verbose.
 
+    Subclassing str (rather than wrapping one) keeps comparisons and string
+    operations at native speed, and the three instances are interned so
+    repeated calls in variable_type do not allocate.
+
     """
     # TODO we can replace this with typing.Literal on Python 3.8+
     allowed = "numeric", "datetime", "categorical"
 
-    def __init__(self, data):
-        assert data in self.allowed, data
-        super().__init__(data)
+    _instances: dict = {}
+
+    def __new__(cls, data):
+        assert data in cls.allowed, data
+        try:
+            return cls._instances[data]
+        except KeyError:
+            return cls._instances.setdefault(data, super().__new__(cls, data))
 
     def __eq__(self, other):
         assert other in self.allowed, other
-        return self.data == other
+        return str.__eq__(self, other)
+
+    # Keep instances usable as dict keys (e.g. for orient dispatch tables)
+    __hash__ = str.__hash__
+
+
+def _all_numeric(x):
+    """Return True if every entry is a Number, stopping at the first miss."""
+    for x_i in x:
+        if not isinstance(x_i, Number):
+            return False
+    return True
+
+
+def _all_datetime(x):
+    """Return True if every entry is a datetime, stopping at the first miss."""
+    for x_i in x:
+        if not isinstance(x_i, (datetime, np.datetime64)):
+            return False
+    return True
 
 
 def variable_type(vector, boolean_type="numeric"):
@@ -1506,6 +1770,21 @@ def variable_type(vector, boolean_type="numeric"):
     vector = vector.dropna()
 
     # Special-case binary/boolean data, allow caller to determine
+    # Resolve well-typed vectors from the dtype, which avoids both the
+    # hashed isin lookup and the numpy comparison warnings it can trigger
+    if pd.api.types.is_bool_dtype(vector):
+        return VariableType(boolean_type)
+
+    if pd.api.types.is_numeric_dtype(vector):
+        arr = vector.to_numpy()
+        if ((arr == 0) | (arr == 1)).all():
+            return VariableType(boolean_type)
+        return VariableType("numeric")
+
+    if pd.api.types.is_datetime64_dtype(vector):
+        return VariableType("datetime")
+
+    # For object-typed vectors, fall back to the elementwise comparison
     # This triggers a numpy warning when vector has strings/objects
     # https://github.com/numpy/numpy/issues/6784
     # Because we reduce with .all(), we are agnostic about whether the
@@ -1525,35 +1804,31 @@ def variable_type(vector, boolean_type="numeric"):
             # casting rules, depending on the (unknown) dtype of 'vector'
             pass
 
-    # Defer to positive pandas tests
-    if pd.api.types.is_numeric_dtype(vector):
-        return VariableType("numeric")
+    # --- If we get to here, we need to check the entries
 
-    if pd.api.types.is_datetime64_dtype(vector):
+    # Let pandas infer the type of the entries with a single C-level pass;
+    # anything it reports as unambiguously numeric or datetime maps directly
+    inferred = pd.api.types.infer_dtype(vector, skipna=True)
+    if inferred in ("integer", "floating", "mixed-integer-float", "complex",
+                    "decimal", "boolean"):
+        return VariableType("numeric")
+    if inferred in ("datetime64", "datetime"):
         return VariableType("datetime")
+    if inferred in ("string", "bytes", "date", "time", "timedelta64",
+                    "timedelta", "period", "mixed-integer"):
+        return VariableType("categorical")
 
-    # --- If we get to here, we need to check the entries
+    # Fully mixed entries need element checks (e.g. Fractions are numeric
+    # but infer as mixed)
 
     # Check for a collection where everything is a number
 
-    def all_numeric(x):
-        for x_i in x:
-            if not isinstance(x_i, Number):
-                return False
-        return True
-
-    if all_numeric(vector):
+    if _all_numeric(vector):
         return VariableType("numeric")
 
     # Check for a collection where everything is a datetime
 
-    def all_datetime(x):
-        for x_i in x:
-            if not isinstance(x_i, (datetime, np.datetime64)):
-                return False
-        return True
-
-    if all_datetime(vector):
+    if _all_datetime(vector):
         return VariableType("datetime")
 
     # Otherwise, our final fallback is to consider things categorical
@@ -1561,6 +1836,31 @@ def variable_type(vector, boolean_type="numeric"):
     return VariableType("categorical")
 
 
+# Orientation implied by each combination of variable types when the
+# caller does not specify one; ambiguous combinations are absent so that
+# infer_orient can apply its require_numeric check before defaulting
+_ORIENT_BY_TYPES = {
+    ("numeric", "numeric"): "x",
+    ("numeric", "categorical"): "y",
+    ("numeric", "datetime"): "y",
+    ("categorical", "numeric"): "x",
+    ("datetime", "numeric"): "x",
+    ("datetime", "categorical"): "y",
+}
+
+
+def _orient_variable_type(vector):
+    """Resolve the variable type from the dtype alone when it discriminates."""
+    kind = getattr(getattr(vector, "dtype", None), "kind", "")
+    if kind in "iufcb":
+        # Binary data also maps to "numeric" here, so the value scan that
+        # variable_type performs to detect it cannot change the answer
+        return VariableType("numeric")
+    if kind == "M":
+        return VariableType("datetime")
+    return variable_type(vector)
+
+
 def infer_orient(x=None, y=None, orient=None, require_numeric=True):
     """Determine how the plot should be oriented based on the data.
 
@@ -1590,32 +1890,36 @@ def infer_orient(x=None, y=None, orient=None, require_numeric=True):
 
     """
 
-    x_type = None if x is None else variable_type(x)
-    y_type = None if y is None else variable_type(y)
+    x_type = None if x is None else _orient_variable_type(x)
+    y_type = None if y is None else _orient_variable_type(y)
+
+    # Only the first character of the orient spec matters, so extract it
+    # once rather than stringifying and prefix-matching per branch below
+    orient_key = "" if orient is None else str(orient)[:1]
 
     nonnumeric_dv_error = "{} orientation requires numeric `{}` variable."
     single_var_warning = "{} orientation ignored with only `{}` specified."
 
     if x is None:
-        if str(orient).startswith("h"):
+        if orient_key == "h":
             warnings.warn(single_var_warning.format("Horizontal", "y"))
         if require_numeric and y_type != "numeric":
             raise TypeError(nonnumeric_dv_error.format("Vertical", "y"))
         return "x"
 
     elif y is None:
-        if str(orient).startswith("v"):
+        if orient_key == "v":
             warnings.warn(single_var_warning.format("Vertical", "x"))
         if require_numeric and x_type != "numeric":
             raise TypeError(nonnumeric_dv_error.format("Horizontal", "x"))
         return "y"
 
-    elif str(orient).startswith("v") or orient == "x":
+    elif orient_key == "v" or orient == "x":
         if require_numeric and y_type != "numeric":
             raise TypeError(nonnumeric_dv_error.format("Vertical", "y"))
         return "x"
 
-    elif str(orient).startswith("h") or orient == "y":
+    elif orient_key == "h" or orient == "y":
         if require_numeric and x_type != "numeric":
             raise TypeError(nonnumeric_dv_error.format("Horizontal", "x"))
         return "y"
@@ -1627,21 +1931,32 @@ def infer_orient(x=None, y=None, orient=None, require_numeric=True):
         )
         raise ValueError(err)
 
-    elif x_type != "categorical" and y_type == "categorical":
-        return "y"
-
-    elif x_type != "numeric" and y_type == "numeric":
-        return "x"
+    # With no explicit orientation, a single table lookup on the variable
+    # types replaces the former branch cascade
+    inferred = _ORIENT_BY_TYPES.get((x_type, y_type))
+    if inferred is not None:
+        return inferred
 
-    elif x_type == "numeric" and y_type != "numeric":
-        return "y"
-
-    elif require_numeric and "numeric" not in (x_type, y_type):
+    if require_numeric and "numeric" not in (x_type, y_type):
         err = "Neither the `x` nor `y` variable appears to be numeric."
         raise TypeError(err)
 
-    else:
-        return "x"
+    return "x"
+
+
+# Well-distinguishable specs that seed the generated dash styles
+_BASE_DASHES = (
+    "",
+    (4, 1.5),
+    (1, 1),
+    (3, 1.25, 1.5, 1.25),
+    (5, 1, 1, 1),
+)
+
+# Specs already generated by unique_dashes, so repeated calls only pay
+# for a list slice; _dash_next_p tracks where generation left off
+_dash_specs = list(_BASE_DASHES)
+_dash_next_p = 3
 
 
 def unique_dashes(n):
@@ -1661,38 +1976,53 @@ def unique_dashes(n):
         dashes.
 
     """
-    # Start with dash specs that are well distinguishable
-    dashes = [
-        "",
-        (4, 1.5),
-        (1, 1),
-        (3, 1.25, 1.5, 1.25),
-        (5, 1, 1, 1),
-    ]
-
-    # Now programmatically build as many as we need
-    p = 3
+    global _dash_next_p
+
+    # The specs are a deterministic function of n; extend the cache from
+    # well-distinguishable seed values only when n outgrows it
+    dashes = _dash_specs
     while len(dashes) < n:
+        p = _dash_next_p
+
+        # Take combinations of long and short dashes, interleaving the two
+        # alphabets with one stream reversed; each row holds the leading
+        # count of long dashes, matching the combinations_with_replacement
+        # ordering this generator historically used
+        cols = np.arange(p)
+        n_long = np.arange(1, p)[:, None]
+        segments = np.empty((2 * (p - 1), p))
+        segments[0::2] = np.where(cols < n_long, 3, 1.25)
+        segments[1::2] = np.where(cols < p - n_long, 4, 1)
+
+        # Now insert the gaps, in one strided fill per stripe
+        gaps = segments.min(axis=1)
+        specs = np.empty((2 * (p - 1), 2 * p))
+        specs[:, 0::2] = segments
+        specs[:, 1::2] = gaps[:, None]
+        dashes.extend(map(tuple, specs.tolist()))
+
+        _dash_next_p += 1
 
-        # Take combinations of long and short dashes
-        a = itertools.combinations_with_replacement([3, 1.25], p)
-        b = itertools.combinations_with_replacement([4, 1], p)
+    return dashes[:n]
 
-        # Interleave the combinations, reversing one of the streams
-        segment_list = itertools.chain(*zip(
-            list(a)[1:-1][::-1],
-            list(b)[1:-1]
-        ))
 
-        # Now insert the gaps
-        for segments in segment_list:
-            gap = min(segments)
-            spec = tuple(itertools.chain(*((seg, gap) for seg in segments)))
-            dashes.append(spec)
+# Well-distinguishable specs that seed the generated marker styles
+_BASE_MARKERS = (
+    "o",
+    "X",
+    (4, 0, 45),
+    "P",
+    (4, 0, 0),
+    (4, 1, 0),
+    "^",
+    (4, 1, 45),
+    "v",
+)
 
-        p += 1
-
-    return dashes[:n]
+# Marker analog of the dash spec cache, extended with regular polygons
+# of increasing order
+_marker_specs = list(_BASE_MARKERS)
+_marker_next_s = 5
 
 
 def unique_markers(n):
@@ -1710,30 +2040,26 @@ def unique_markers(n):
         All markers will be filled.
 
     """
-    # Start with marker specs that are well distinguishable
-    markers = [
-        "o",
-        "X",
-        (4, 0, 45),
-        "P",
-        (4, 0, 0),
-        (4, 1, 0),
-        "^",
-        (4, 1, 45),
-        "v",
-    ]
-
-    # Now generate more from regular polygons of increasing order
-    s = 5
-    while len(markers) < n:
+    global _marker_next_s
+
+    # As with the dash specs, extend the cached list only when needed
+    markers = _marker_specs
+    if len(markers) < n:
+        # Generate more from regular polygons of increasing order, doing
+        # the arithmetic for all new orders with one vectorized pass
+        k = -((len(markers) - n) // 4)
+        s = np.arange(_marker_next_s, _marker_next_s + k)
         a = 360 / (s + 1) / 2
-        markers.extend([
-            (s + 1, 1, a),
-            (s + 1, 0, a),
-            (s, 1, 0),
-            (s, 0, 0),
-        ])
-        s += 1
+        block = np.empty((k, 4, 3))
+        block[:, 0] = np.column_stack([s + 1, np.ones(k), a])
+        block[:, 1] = np.column_stack([s + 1, np.zeros(k), a])
+        block[:, 2] = np.column_stack([s, np.ones(k), np.zeros(k)])
+        block[:, 3] = np.column_stack([s, np.zeros(k), np.zeros(k)])
+        markers.extend(
+            (int(sides), int(style), angle)
+            for sides, style, angle in block.reshape(-1, 3).tolist()
+        )
+        _marker_next_s += k
 
     # Convert to MarkerStyle object, using only exactly what we need
     # markers = [mpl.markers.MarkerStyle(m) for m in markers[:n]]
@@ -1767,11 +2093,49 @@ def categorical_order(vector, order=None):
             try:
                 order = vector.cat.categories
             except (TypeError, AttributeError):
+                order = None
 
-                order = pd.Series(vector).unique()
-
-                if variable_type(vector) == "numeric":
-                    order = np.sort(order)
+        if order is not None:
+            # Categories are already unique and (almost always) non-null,
+            # so skip the per-element null filter below
+            if not order.hasnans:
+                return order.tolist()
+        else:
+            if isinstance(vector, pd.Series):
+                series = vector
+            else:
+                series = pd.Series(vector)
+
+            # A well-typed dtype settles numeric-ness on its own; only
+            # object-typed data needs the full (value-scanning) inference
+            kind = series.dtype.kind
+            if kind in "iufcb":
+                numeric = True
+            elif kind in "Mm":
+                numeric = False
+            else:
+                numeric = variable_type(series) == "numeric"
+
+            if numeric:
+                arr = series.to_numpy()
+                if arr.dtype.kind in "iufb":
+                    if arr.dtype.kind == "f":
+                        arr = arr[~np.isnan(arr)]
+                    if arr.size > 1 and (arr[1:] >= arr[:-1]).all():
+                        # Already sorted (e.g. downstream of a groupby):
+                        # dedupe with a linear scan instead of re-sorting
+                        keep = np.empty(arr.size, dtype=bool)
+                        keep[0] = True
+                        np.not_equal(arr[1:], arr[:-1], out=keep[1:])
+                        return arr[keep].tolist()
+                    # One mask, one fused dedupe-and-sort; nulls are gone,
+                    # so skip the generic filtering below as well
+                    return np.unique(arr).tolist()
+                order = np.sort(series.unique())
+            else:
+                order = series.unique()
 
-        order = filter(pd.notnull, order)
+        # Drop nulls with one vectorized mask rather than a Python-level
+        # callback per element; every branch above yields an array-like
+        order = order[pd.notnull(order)]
     return list(order)
@@ -1,18 +1,85 @@
 from __future__ import annotations
-from typing import Literal
+import copy
+import operator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 import pandas as pd
-import matplotlib as mpl
-from matplotlib.figure import Figure
 from seaborn.utils import _version_predates
 
+if TYPE_CHECKING:
+    import matplotlib as mpl
+    from matplotlib.figure import Figure
+
+
+_scaled_norm_cls = None
+
+
+def _get_scaled_norm_cls():
+    """Build the ScaledNorm class once, on first use."""
+    global _scaled_norm_cls
+    if _scaled_norm_cls is None:
+        import matplotlib as mpl
+
+        class ScaledNorm(mpl.colors.Normalize):
+
+            _bounds_cache = None
+
+            def __call__(self, value, clip=None):
+                # From github.com/matplotlib/matplotlib/blob/v3.4.2/lib/matplotlib/colors.py  # noqa: E501
+                # See github.com/matplotlib/matplotlib/tree/v3.4.2/LICENSE
+                value, is_scalar = self.process_value(value)
+                self.autoscale_None(value)
+                if self.vmin > self.vmax:
+                    raise ValueError("vmin must be less or equal to vmax")
+                if self.vmin == self.vmax:
+                    # Cheaper than full_like; value is masked by process_value
+                    return np.ma.zeros(value.shape, dtype=value.dtype)
+                if clip is None:
+                    clip = self.clip
+                if clip:
+                    # process_value copied, so clipping in place is safe
+                    value = np.clip(value, self.vmin, self.vmax, out=value)
+                # ***** Seaborn changes start ****
+                t_value = self.transform(value)
+                if t_value.shape != np.shape(value):
+                    t_value = t_value.reshape(np.shape(value))
+                # The transformed limits only change when the limits do,
+                # so reuse them across calls on the same data range
+                if self._bounds_cache is None or self._bounds_cache[:2] != (
+                    self.vmin, self.vmax
+                ):
+                    t_vmin, t_vmax = self.transform([self.vmin, self.vmax])
+                    if not (np.isfinite(t_vmin) and np.isfinite(t_vmax)):
+                        raise ValueError("Invalid vmin or vmax")
+                    self._bounds_cache = self.vmin, self.vmax, t_vmin, t_vmax
+                else:
+                    _, _, t_vmin, t_vmax = self._bounds_cache
+                np.subtract(t_value, t_vmin, out=t_value)
+                np.multiply(t_value, 1 / (t_vmax - t_vmin), out=t_value)
+                if clip:
+                    # Clipped values transform to finite results (the limits
+                    # were checked above), so masking would be a no-op
+                    return t_value[0] if is_scalar else t_value
+                # Mask with one isfinite pass rather than masked_invalid,
+                # which validates and scans the array a second time
+                mask = ~np.isfinite(t_value)
+                # ***** Seaborn changes end *****
+                t_value = np.ma.MaskedArray(t_value, mask=mask, copy=False)
+                return t_value[0] if is_scalar else t_value
+
+        _scaled_norm_cls = ScaledNorm
+    return _scaled_norm_cls
+
 
 def norm_from_scale(scale, norm):
     """Produce a Normalize object given a Scale and min/max domain limits."""
     # This is an internal maplotlib function that simplifies things to access
     # It is likely to become part of the matplotlib API at some point:
     # https://github.com/matplotlib/matplotlib/issues/20329
+    import matplotlib as mpl
+
     if isinstance(norm, mpl.colors.Normalize):
         return norm
 
@@ -24,53 +91,61 @@ def norm_from_scale(scale, norm):
     else:
         vmin, vmax = norm  # TODO more helpful error if this fails?
 
-    class ScaledNorm(mpl.colors.Normalize):
-
-        def __call__(self, value, clip=None):
-            # From github.com/matplotlib/matplotlib/blob/v3.4.2/lib/matplotlib/colors.py
-            # See github.com/matplotlib/matplotlib/tree/v3.4.2/LICENSE
-            value, is_scalar = self.process_value(value)
-            self.autoscale_None(value)
-            if self.vmin > self.vmax:
-                raise ValueError("vmin must be less or equal to vmax")
-            if self.vmin == self.vmax:
-                return np.full_like(value, 0)
-            if clip is None:
-                clip = self.clip
-            if clip:
-                value = np.clip(value, self.vmin, self.vmax)
-            # ***** Seaborn changes start ****
-            t_value = self.transform(value).reshape(np.shape(value))
-            t_vmin, t_vmax = self.transform([self.vmin, self.vmax])
-            # ***** Seaborn changes end *****
-            if not np.isfinite([t_vmin, t_vmax]).all():
-                raise ValueError("Invalid vmin or vmax")
-            t_value -= t_vmin
-            t_value /= (t_vmax - t_vmin)
-            t_value = np.ma.masked_invalid(t_value, copy=False)
-            return t_value[0] if is_scalar else t_value
-
-    new_norm = ScaledNorm(vmin, vmax)
-    new_norm.transform = scale.get_transform().transform
+    transform = scale.get_transform()
+    if isinstance(transform, mpl.transforms.IdentityTransform):
+        # The custom subclass would be a no-op; use the stock implementation
+        return mpl.colors.Normalize(vmin, vmax)
+
+    new_norm = _get_scaled_norm_cls()(vmin, vmax)
+    new_norm.transform = transform.transform
+
+    if vmin is not None and vmax is not None:
+        # Seed the bounds cache so even the first call skips transforming them
+        t_vmin, t_vmax = new_norm.transform([vmin, vmax])
+        if np.isfinite(t_vmin) and np.isfinite(t_vmax):
+            new_norm._bounds_cache = vmin, vmax, t_vmin, t_vmax
 
     return new_norm
 
 
-def get_colormap(name):
-    """Handle changes to matplotlib colormap interface in 3.6."""
+@lru_cache(maxsize=64)
+def _lookup_colormap(name):
+    import matplotlib as mpl
     try:
         return mpl.colormaps[name]
     except AttributeError:
         return mpl.cm.get_cmap(name)
 
 
+def get_colormap(name):
+    """Handle changes to matplotlib colormap interface in 3.6.
+
+    The registry lookup is cached, but each caller gets its own copy (as
+    with mpl.colormaps itself) so mutating the result cannot leak across
+    uses of the same name.
+
+    """
+    return copy.copy(_lookup_colormap(name))
+
+
+_registered_cmaps = set()
+
+
 def register_colormap(name, cmap):
     """Handle changes to matplotlib colormap interface in 3.6."""
+    if name in _registered_cmaps:
+        return
+    import matplotlib as mpl
     try:
         if name not in mpl.colormaps:
             mpl.colormaps.register(cmap, name=name)
     except AttributeError:
         mpl.cm.register_cmap(name, cmap)
+    _registered_cmaps.add(name)
+    _lookup_colormap.cache_clear()
+
+
+_set_layout_engine_impl = None
 
 
 def set_layout_engine(
@@ -78,43 +153,74 @@ def set_layout_engine(
     engine: Literal["constrained", "compressed", "tight", "none"],
 ) -> None:
     """Handle changes to auto layout engine interface in 3.6"""
-    if hasattr(fig, "set_layout_engine"):
-        fig.set_layout_engine(engine)
-    else:
-        # _version_predates(mpl, 3.6)
-        if engine == "tight":
-            fig.set_tight_layout(True)  # type: ignore  # predates typing
-        elif engine == "constrained":
-            fig.set_constrained_layout(True)  # type: ignore
-        elif engine == "none":
-            fig.set_tight_layout(False)  # type: ignore
-            fig.set_constrained_layout(False)  # type: ignore
+    global _set_layout_engine_impl
+    if _set_layout_engine_impl is None:
+        # The capability is a property of the installed matplotlib,
+        # so resolve the dispatch once rather than probing every figure.
+        from matplotlib.figure import Figure
+
+        if hasattr(Figure, "set_layout_engine"):
+            def _set_layout_engine_impl(fig, engine):
+                fig.set_layout_engine(engine)
+        else:
+            # _version_predates(mpl, 3.6)
+            def _set_layout_engine_impl(fig, engine):
+                if engine == "tight":
+                    fig.set_tight_layout(True)  # type: ignore  # predates typing
+                elif engine == "constrained":
+                    fig.set_constrained_layout(True)  # type: ignore
+                elif engine == "none":
+                    fig.set_tight_layout(False)  # type: ignore
+                    fig.set_constrained_layout(False)  # type: ignore
+    _set_layout_engine_impl(fig, engine)
+
+
+_has_get_layout_engine = None
 
 
 def get_layout_engine(fig: Figure) -> mpl.layout_engine.LayoutEngine | None:
     """Handle changes to auto layout engine interface in 3.6"""
-    if hasattr(fig, "get_layout_engine"):
+    global _has_get_layout_engine
+    if _has_get_layout_engine is None:
+        from matplotlib.figure import Figure
+        _has_get_layout_engine = hasattr(Figure, "get_layout_engine")
+    if _has_get_layout_engine:
         return fig.get_layout_engine()
     else:
         # _version_predates(mpl, 3.6)
         return None
 
 
+_share_axis_impl = None
+
+
 def share_axis(ax0, ax1, which):
     """Handle changes to post-hoc axis sharing."""
-    if _version_predates(mpl, "3.5"):
-        group = getattr(ax0, f"get_shared_{which}_axes")()
-        group.join(ax1, ax0)
-    else:
-        getattr(ax1, f"share{which}")(ax0)
+    global _share_axis_impl
+    if _share_axis_impl is None:
+        import matplotlib as mpl
+        if _version_predates(mpl, "3.5"):
+            def _share_axis_impl(ax0, ax1, which):
+                group = getattr(ax0, f"get_shared_{which}_axes")()
+                group.join(ax1, ax0)
+        else:
+            def _share_axis_impl(ax0, ax1, which):
+                getattr(ax1, f"share{which}")(ax0)
+    _share_axis_impl(ax0, ax1, which)
+
+
+_legend_handles_getter = None
 
 
 def get_legend_handles(legend):
     """Handle legendHandles attribute rename."""
-    if _version_predates(mpl, "3.7"):
-        return legend.legendHandles
-    else:
-        return legend.legend_handles
+    global _legend_handles_getter
+    if _legend_handles_getter is None:
+        import matplotlib as mpl
+        _legend_handles_getter = operator.attrgetter(
+            "legendHandles" if _version_predates(mpl, "3.7") else "legend_handles"
+        )
+    return _legend_handles_getter(legend)
 
 
 def groupby_apply_include_groups(val):
@@ -180,8 +180,10 @@ class PlotData:
             source_data = data
 
         # Variables can also be extracted from the index of a DataFrame
+        # Materializing levels lazily avoids a full index copy when (as is
+        # typical) no variable references an index level
         if isinstance(source_data, pd.DataFrame):
-            index = source_data.index.to_frame().to_dict("series")
+            index = _IndexFields(source_data.index)
         else:
             index = {}
 
@@ -262,11 +264,30 @@ class PlotData:
         # Construct a tidy plot DataFrame. This will convert a number of
         # types automatically, aligning on index in case of pandas objects
         # TODO Note: this fails when variable specs *only* have scalars!
-        frame = pd.DataFrame(plot_data)
+        if any(isinstance(v, (pd.Series, pd.Index)) for v in plot_data.values()):
+            frame = pd.DataFrame(plot_data)
+        else:
+            # With no indexed inputs there is nothing to align, and the
+            # constructor can be allowed to share the input buffers
+            frame = pd.DataFrame(plot_data, copy=False)
 
         return frame, names, ids
 
 
+class _IndexFields:
+    """Lazy mapping from index level names to level values."""
+
+    def __init__(self, index: pd.Index):
+        self._index = index
+
+    def __contains__(self, name: object) -> bool:
+        return name in (self._index.names or [])
+
+    def __getitem__(self, name: str) -> pd.Series:
+        values = self._index.get_level_values(name)
+        return pd.Series(values, index=self._index, name=name)
+
+
 def handle_data_source(data: object) -> pd.DataFrame | Mapping | None:
     """Convert the data source object to a common union representation."""
     if isinstance(data, pd.DataFrame) or hasattr(data, "__dataframe__"):
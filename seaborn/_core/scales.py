@@ -86,14 +86,9 @@ class Scale:
         major_locator, minor_locator = self._get_locators(**self._tick_params)
         major_formatter = self._get_formatter(major_locator, **self._label_params)
 
-        class InternalScale(mpl.scale.FuncScale):
-            def set_default_locators_and_formatters(self, axis):
-                axis.set_major_locator(major_locator)
-                if minor_locator is not None:
-                    axis.set_minor_locator(minor_locator)
-                axis.set_major_formatter(major_formatter)
-
-        return InternalScale(name, (forward, inverse))
+        return _InternalScale(
+            name, (forward, inverse), major_locator, minor_locator, major_formatter,
+        )
 
     def _spacing(self, x: Series) -> float:
         space = self._spacer(x)
@@ -238,6 +233,33 @@ class Boolean(Scale):
         return FuncFormatter(lambda x, _: str(bool(x)))
 
 
+class _InternalScale(mpl.scale.FuncScale):
+    # Parameterized so Scale._get_scale does not rebuild the class per call
+
+    def __init__(self, name, functions, major_locator, minor_locator, major_formatter):
+        super().__init__(name, functions)
+        self._major_locator = major_locator
+        self._minor_locator = minor_locator
+        self._major_formatter = major_formatter
+
+    def set_default_locators_and_formatters(self, axis):
+        axis.set_major_locator(self._major_locator)
+        if self._minor_locator is not None:
+            axis.set_minor_locator(self._minor_locator)
+        axis.set_major_formatter(self._major_formatter)
+
+
+class _CatScale(mpl.scale.LinearScale):
+    # Defined at module level so Nominal._setup does not rebuild it per call
+
+    def set_default_locators_and_formatters(self, axis):
+        ...
+        # axis.set_major_locator(major_locator)
+        # if minor_locator is not None:
+        #     axis.set_minor_locator(minor_locator)
+        # axis.set_major_formatter(major_formatter)
+
+
 @dataclass
 class Nominal(Scale):
     """
@@ -277,15 +299,7 @@ class Nominal(Scale):
         # major_locator, minor_locator = new._get_locators(**new._tick_params)
         # major_formatter = new._get_formatter(major_locator, **new._label_params)
 
-        class CatScale(mpl.scale.LinearScale):
-            def set_default_locators_and_formatters(self, axis):
-                ...
-                # axis.set_major_locator(major_locator)
-                # if minor_locator is not None:
-                #     axis.set_minor_locator(minor_locator)
-                # axis.set_major_formatter(major_formatter)
-
-        mpl_scale = CatScale(data.name)
+        mpl_scale = _CatScale(data.name)
         if axis is None:
             axis = PseudoAxis(mpl_scale)
 
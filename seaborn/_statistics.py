@@ -182,8 +182,13 @@ class KDE:
 
         else:
 
-            xx1, xx2 = np.meshgrid(*support)
-            density = kde([xx1.ravel(), xx2.ravel()]).reshape(xx1.shape)
+            grid1, grid2 = support
+            # Fill the evaluation points directly, rather than materializing
+            # two full meshgrid arrays only to ravel and re-stack them
+            pts = np.empty((2, grid1.size * grid2.size))
+            pts[0] = np.tile(grid1, grid2.size)
+            pts[1] = np.repeat(grid2, grid1.size)
+            density = kde(pts).reshape(grid2.size, grid1.size)
 
         return density, support
 
@@ -1,7 +1,6 @@
 from collections import namedtuple
 from textwrap import dedent
 import warnings
-from colorsys import rgb_to_hls
 from functools import partial
 
 import numpy as np
@@ -330,9 +329,10 @@ class _CategoricalPlotter(VectorPlotter):
             basis = [mpl.colors.to_rgb(base_color)]
         else:
             basis = [mpl.colors.to_rgb(c) for c in hue_map.lookup_table.values()]
-        unique_colors = np.unique(basis, axis=0)
-        light_vals = [rgb_to_hls(*rgb[:3])[1] for rgb in unique_colors]
-        lum = min(light_vals) * .6
+        unique_colors = np.unique(basis, axis=0)[:, :3]
+        # HLS lightness is (max + min) / 2, which vectorizes trivially
+        light_vals = (unique_colors.max(axis=1) + unique_colors.min(axis=1)) / 2
+        lum = light_vals.min() * .6
         return (lum, lum, lum)
 
     def _map_prop_with_hue(self, name, value, fallback, plot_kws):
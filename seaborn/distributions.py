@@ -545,7 +545,7 @@ class _DistributionPlotter(VectorPlotter):
         hist_artists = []
 
         # Go back through the dataset and draw the plots
-        for sub_vars, _ in self.iter_data("hue", reverse=True):
+        for sub_vars, _ in self.iter_data("hue", reverse=True, copy=False):
 
             key = tuple(sub_vars.items())
             hist = histograms[key].rename("heights").reset_index()
@@ -674,7 +674,7 @@ class _DistributionPlotter(VectorPlotter):
             default_linewidth = math.inf
 
             # Loop through subsets based only on facet variables
-            for sub_vars, _ in self.iter_data():
+            for sub_vars, _ in self.iter_data(copy=False):
 
                 ax = self._get_axes(sub_vars)
 
@@ -959,7 +959,7 @@ class _DistributionPlotter(VectorPlotter):
 
         # Now iterate through the subsets and draw the densities
         # We go backwards so stacked densities read from top-to-bottom
-        for sub_vars, _ in self.iter_data("hue", reverse=True):
+        for sub_vars, _ in self.iter_data("hue", reverse=True, copy=False):
 
             # Extract the support grid and density curve for this level
             key = tuple(sub_vars.items())
@@ -1145,7 +1145,7 @@ class _DistributionPlotter(VectorPlotter):
                 contour_kws["cmap"] = cmap
 
         # Loop through the subsets again and plot the data
-        for sub_vars, _ in self.iter_data("hue"):
+        for sub_vars, _ in self.iter_data("hue", copy=False):
 
             if "hue" in sub_vars:
                 color = self._hue_map(sub_vars["hue"])
@@ -2378,13 +2378,14 @@ def _freedman_diaconis_bins(a):
     a = np.asarray(a)
     if len(a) < 2:
         return 1
-    iqr = np.subtract.reduce(np.nanpercentile(a, [75, 25]))
-    h = 2 * iqr / (len(a) ** (1 / 3))
+    # One selection pass gets the range and the quartiles together
+    amin, q25, q75, amax = np.nanpercentile(a, [0, 25, 75, 100])
+    h = 2 * (q75 - q25) / (len(a) ** (1 / 3))
     # fall back to sqrt(a) bins if iqr is 0
     if h == 0:
         return int(np.sqrt(a.size))
     else:
-        return int(np.ceil((a.max() - a.min()) / h))
+        return int(np.ceil((amax - amin) / h))
 
 
 def distplot(a=None, bins=None, hist=True, kde=True, rug=False, fit=None,
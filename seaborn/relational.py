@@ -15,6 +15,7 @@ from .utils import (
     _default_color,
     _deprecate_ci,
     _get_transform_functions,
+    _marker_style,
     _scatter_legend_artist,
 )
 from ._compat import groupby_apply_include_groups
@@ -430,7 +431,7 @@ class _ScatterPlotter(_RelationalPlotter):
         m = kws.get("marker", mpl.rcParams.get("marker", "o"))
         if not isinstance(m, mpl.markers.MarkerStyle):
             # TODO in more recent matplotlib (which?) can pass a MarkerStyle here
-            m = mpl.markers.MarkerStyle(m)
+            m = _marker_style(m)
         if m.is_filled():
             kws.setdefault("edgecolor", "w")
 
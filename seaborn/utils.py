@@ -4,6 +4,7 @@ import inspect
 import warnings
 import colorsys
 from contextlib import contextmanager
+from functools import lru_cache
 from urllib.request import urlopen, urlretrieve
 from types import ModuleType
 
@@ -851,6 +852,21 @@ def _disable_autolayout():
         mpl.rcParams["figure.autolayout"] = orig_val
 
 
+@lru_cache(maxsize=64)
+def _cached_marker_style(marker, fillstyle):
+    return mpl.markers.MarkerStyle(marker, fillstyle=fillstyle)
+
+
+def _marker_style(marker, fillstyle=None):
+    """Convert a marker spec to a MarkerStyle, caching hashable specs."""
+    try:
+        return _cached_marker_style(marker, fillstyle)
+    except TypeError:
+        # Unhashable spec (e.g. a list vertex sequence); build directly
+        return mpl.markers.MarkerStyle(marker, fillstyle=fillstyle)
+
+
+@lru_cache(maxsize=None)
 def _version_predates(lib: ModuleType, version: str) -> bool:
     """Helper function for checking version compatibility."""
     return Version(lib.__version__) < Version(version)